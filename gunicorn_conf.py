@@ -0,0 +1,11 @@
+"""Gunicorn config — gevent workers so Etherscan/LLM waits overlap.
+
+Run with: USE_GEVENT=1 gunicorn -c gunicorn_conf.py server:app
+"""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '10000')}"
+worker_class = "gevent"
+workers = 2
+worker_connections = 1000
+timeout = 120
@@ -0,0 +1,28 @@
+"""Live OpenGradient smoke check — spends real $OPG, run by hand only.
+
+Usage: OG_PRIVATE_KEY=0x... python scripts/smoke_og.py
+"""
+import os
+
+import opengradient as og
+
+
+def main():
+    client = og.Client(private_key=os.environ["OG_PRIVATE_KEY"])
+
+    client.llm.ensure_opg_approval(opg_amount=5.0)
+
+    result = client.llm.chat(
+        model=og.TEE_LLM.GEMINI_2_5_FLASH,
+        messages=[
+            {"role": "user", "content": "What is Ethereum in one sentence?"}
+        ],
+        max_tokens=100
+    )
+
+    print(f"Response: {result.chat_output['content']}")
+    print(f"Payment hash: {result.payment_hash}")
+
+
+if __name__ == "__main__":
+    main()
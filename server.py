@@ -4,59 +4,146 @@ server.py — Verifiable Transaction Hash Reader
 USDC addresses from official Circle docs. USDT from official Tether deployments.
 """
 import os
+
+# Monkey-patching must happen before anything pulls in socket/ssl, so this
+# sits above every other import. Opt-in via USE_GEVENT=1 (see gunicorn_conf.py).
+if os.environ.get("USE_GEVENT"):
+    from gevent import monkey
+    monkey.patch_all()
+
+import re
 import json
+import queue
+import hashlib
+import logging
+import logging.handlers
+import random
 import secrets
-import traceback
 import sys
 import time
-import urllib.request
-import urllib.error
 import threading
+import collections
+import requests as _requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from flask import Flask, request, jsonify, send_from_directory
+from cachetools import TTLCache
+from flask import Flask, request, send_from_directory, Response, stream_with_context
 from flask_cors import CORS
 from dotenv import load_dotenv
 
 load_dotenv()
 
+# ── Logging — a QueueHandler hands records to a listener thread, so the
+# request path never blocks on a stdout write() syscall.
+_log_queue = queue.SimpleQueue()
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+logging.basicConfig(
+    level=logging.INFO,
+    format="%(asctime)s %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)],
+)
+log = logging.getLogger("explainer")
+
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj, separators=(",", ":"))
+
 app = Flask(__name__, static_folder="public", static_url_path="")
+app.config["SEND_FILE_MAX_AGE_DEFAULT"] = 3600
 CORS(app)
 
+try:
+    from flask_compress import Compress
+    app.config["COMPRESS_MIMETYPES"] = ["application/json", "text/html", "text/markdown"]
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"]
+    Compress(app)
+except ImportError:
+    pass
+
 # ── OpenGradient Setup ───────────────────────────────────────
+# The SDK drags in web3/eth_account/cryptography — hundreds of ms of
+# import and a chunk of RSS — so it loads on the first real LLM request
+# instead of at worker boot. Mock deployments never pay for it.
 OG_AVAILABLE = False
 og = None
 
-try:
-    import opengradient as _og
-    og = _og
-    OG_AVAILABLE = True
-    print("✅ OpenGradient SDK imported", flush=True)
-except Exception as e:
-    print(f"⚠️  OpenGradient not available: {e}", flush=True)
 
+def _import_og():
+    global og, OG_AVAILABLE
+    if og is None:
+        try:
+            import opengradient as _og
+            og = _og
+            OG_AVAILABLE = True
+            log.info("✅ OpenGradient SDK imported")
+        except Exception as e:
+            log.warning(f"⚠️  OpenGradient not available: {e}")
+    return og
+
+# Tri-state: None = unchecked, False = unavailable (don't retry), else client.
+# The False sentinel stops every request from re-reading the env and
+# re-scanning the key on deployments that never configure OpenGradient.
 _og_client = None
+_og_client_lock = threading.Lock()
+
+
+def _pool_og_transport(client):
+    """Best-effort: if the SDK carries a requests.Session, mount a pooled
+    keep-alive adapter on it so each chat call reuses one TLS connection
+    instead of paying a fresh handshake per inference."""
+    for obj in (client, getattr(client, "llm", None)):
+        if obj is None:
+            continue
+        for attr in ("session", "_session", "http", "_http"):
+            sess = getattr(obj, attr, None)
+            if isinstance(sess, _requests.Session):
+                sess.mount("https://", HTTPAdapter(
+                    pool_connections=16, pool_maxsize=64,
+                    max_retries=Retry(total=0),
+                ))
+                log.info("✅ Pooled OG transport (%s.%s)", type(obj).__name__, attr)
+                return
+    log.debug("OG client exposes no requests.Session to pool")
 
 
 def get_og_client():
+    # Double-checked locking: the settled fast path never takes the lock,
+    # and concurrent first requests can't each build a client (key
+    # derivation + approval is the dominant non-LLM cost).
     global _og_client
     if _og_client is not None:
-        return _og_client
-    if not OG_AVAILABLE:
-        return None
-    private_key = os.environ.get("OG_PRIVATE_KEY", "")
-    if not private_key or "YOUR_PRIVATE_KEY" in private_key:
-        return None
-    try:
-        _og_client = og.Client(private_key=private_key)
+        return _og_client or None
+    with _og_client_lock:
+        if _og_client is not None:
+            return _og_client or None
+        private_key = os.environ.get("OG_PRIVATE_KEY", "")
+        if not private_key or "YOUR_PRIVATE_KEY" in private_key:
+            _og_client = False
+            return None
+        if _import_og() is None:
+            _og_client = False
+            return None
         try:
-            _og_client.llm.ensure_opg_approval(opg_amount=5.0)
-        except Exception:
-            pass
-        print("✅ OG client ready", flush=True)
-        return _og_client
-    except Exception as e:
-        print(f"❌ OG client failed: {e}", flush=True)
-        return None
+            client = og.Client(private_key=private_key)
+            try:
+                client.llm.ensure_opg_approval(opg_amount=5.0)
+            except Exception:
+                pass
+            _pool_og_transport(client)
+            log.info("✅ OG client ready")
+            _og_client = client
+            return client
+        except Exception as e:
+            log.error(f"❌ OG client failed: {e}")
+            _og_client = False
+            return None
 
 
 # ══════════════════════════════════════════════════════════════
@@ -203,7 +290,7 @@ PUBLIC_RPC = {
     43113:    "https://api.avax-test.network/ext/bc/C/rpc",
 }
 
-ALL_CHAINS = [
+ALL_CHAINS = (
     # ── Priority mainnets (tried first) ──
     {"name": "Ethereum",        "chainid": 1,         "symbol": "ETH",    "explorer": "https://etherscan.io",              "testnet": False},
     {"name": "Base",            "chainid": 8453,      "symbol": "ETH",    "explorer": "https://basescan.org",              "testnet": False},
@@ -279,9 +366,9 @@ ALL_CHAINS = [
     {"name": "Stable Testnet",      "chainid": 2201,      "symbol": "STB",   "explorer": "https://testnet.stablescan.xyz",     "testnet": True},
     {"name": "Plasma Testnet",      "chainid": 9746,      "symbol": "ETH",   "explorer": "https://testnet.plasmascan.io",      "testnet": True},
     {"name": "MegaETH Testnet",     "chainid": 6342,      "symbol": "ETH",   "explorer": "https://testnet.megaethscan.io",     "testnet": True},
-]
+)
 
-print(f"📡 {len(ALL_CHAINS)} chains | {len(KNOWN_TOKENS)} tokens", flush=True)
+log.info(f"📡 {len(ALL_CHAINS)} chains | {len(KNOWN_TOKENS)} tokens")
 
 
 # ══════════════════════════════════════════════════════════════
@@ -292,29 +379,50 @@ _v2_last_call = 0.0
 V2_MIN_INTERVAL = 0.22
 
 
-def _rate_limited_get(url, timeout=10):
+# ── Shared HTTP session — keep-alive avoids a TLS handshake per call ──
+SESSION = _requests.Session()
+SESSION.headers["User-Agent"] = "WalletExplainer/1.0"
+SESSION.mount("https://", HTTPAdapter(
+    pool_connections=32, pool_maxsize=64,
+    max_retries=Retry(total=1, backoff_factor=0.1),
+))
+
+
+def _v2_throttle():
     global _v2_last_call
     with _v2_lock:
-        now = time.time()
+        now = time.perf_counter()
         wait = V2_MIN_INTERVAL - (now - _v2_last_call)
         if wait > 0:
             time.sleep(wait)
-        _v2_last_call = time.time()
-    req = urllib.request.Request(url, headers={"User-Agent": "WalletExplainer/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode())
+        _v2_last_call = time.perf_counter()
+
+
+def _rate_limited_get(url, timeout=10):
+    _v2_throttle()
+    return SESSION.get(url, timeout=timeout).json()
+
+
+def _rate_limited_post(url, payload, timeout=10):
+    _v2_throttle()
+    return SESSION.post(url, json=payload, timeout=timeout).json()
 
 
 def _http_get(url, timeout=10):
-    req = urllib.request.Request(url, headers={"User-Agent": "WalletExplainer/1.0"})
-    with urllib.request.urlopen(req, timeout=timeout) as resp:
-        return json.loads(resp.read().decode())
+    return SESSION.get(url, timeout=timeout).json()
 
 
 # ══════════════════════════════════════════════════════════════
 # TRANSACTION FETCHING
 # ══════════════════════════════════════════════════════════════
 
+# ERC-20 Transfer(address,address,uint256) event signature
+TRANSFER_TOPIC = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
+
+# Strict 32-byte hex hash — rejects garbage before any chain is probed
+HASH_RE = re.compile(r"^0x[0-9a-fA-F]{64}$")
+
+
 def _parse_tx(result, receipt, chain):
     """Parse JSON-RPC tx + receipt. Calls resolve_token for every ERC-20 log."""
     value_wei = int(result.get("value", "0x0"), 16)
@@ -328,19 +436,25 @@ def _parse_tx(result, receipt, chain):
     symbol = chain["symbol"]
 
     token_transfers = []
-    transfer_topic = "0xddf252ad1be2c89b69c2b068fc378daa952ba7f163c4a11628f55a4df523b3ef"
     if receipt and receipt.get("logs"):
-        for log in receipt["logs"]:
-            topics = log.get("topics", [])
-            if topics and topics[0] == transfer_topic and len(topics) >= 3:
-                raw_amount = int(log.get("data", "0x0"), 16)
-                token_name, formatted_amt = resolve_token(log.get("address", ""), raw_amount)
-                token_transfers.append({
-                    "token": token_name,
-                    "amount": formatted_amt,
-                    "from": "0x" + topics[1][-40:],
-                    "to": "0x" + topics[2][-40:],
-                })
+        for entry in receipt["logs"]:
+            topics = entry.get("topics", [])
+            if len(topics) < 3 or topics[0] != TRANSFER_TOPIC:
+                continue
+            # Fixed-width bytes decode beats arbitrary-precision int(x, 16)
+            # on receipts with dozens of Transfer logs (aggregators).
+            data_hex = entry.get("data", "0x")
+            try:
+                raw_amount = int.from_bytes(bytes.fromhex(data_hex[2:]), "big")
+            except ValueError:
+                raw_amount = int(data_hex, 16)
+            token_name, formatted_amt = resolve_token(entry.get("address", ""), raw_amount)
+            token_transfers.append({
+                "token": token_name,
+                "amount": formatted_amt,
+                "from": "0x" + topics[1][-40:],
+                "to": "0x" + topics[2][-40:],
+            })
 
     tx_hash = result.get("hash", "")
     return {
@@ -384,8 +498,29 @@ def _try_direct_api(tx_hash, chain):
 def _try_v2_api(tx_hash, chain):
     api_key = ETHERSCAN_KEY or "YourApiKeyToken"
     chainid = chain["chainid"]
+    url_base = f"https://api.etherscan.io/v2/api?chainid={chainid}&apikey={api_key}"
+    # Batched JSON-RPC POST: tx + receipt in one round-trip. A list response
+    # means the endpoint understood the batch, so its answer is final (a null
+    # tx result is a real miss, not a reason to retry over GET).
+    try:
+        batch = [
+            {"jsonrpc": "2.0", "id": 1, "method": "eth_getTransactionByHash", "params": [tx_hash]},
+            {"jsonrpc": "2.0", "id": 2, "method": "eth_getTransactionReceipt", "params": [tx_hash]},
+        ]
+        data = _rate_limited_post(url_base, batch)
+        if isinstance(data, list):
+            by_id = {item.get("id"): item.get("result") for item in data if isinstance(item, dict)}
+            result = by_id.get(1)
+            if not isinstance(result, dict):
+                return None
+            receipt = by_id.get(2)
+            if not isinstance(receipt, dict):
+                receipt = {}
+            return _parse_tx(result, receipt, chain)
+    except Exception:
+        pass
+    # Query-string fallback (two round-trips) for endpoints that reject batches
     try:
-        url_base = f"https://api.etherscan.io/v2/api?chainid={chainid}&apikey={api_key}"
         data = _rate_limited_get(f"{url_base}&module=proxy&action=eth_getTransactionByHash&txhash={tx_hash}")
         if "rate limit" in data.get("message", "").lower():
             time.sleep(1)
@@ -409,13 +544,9 @@ def _try_rpc(tx_hash, chain):
         return None
     try:
         def rpc_call(method, params):
-            payload = json.dumps({"jsonrpc": "2.0", "id": 1, "method": method, "params": params}).encode()
-            req = urllib.request.Request(rpc_url, data=payload, headers={
-                "Content-Type": "application/json",
-                "User-Agent": "WalletExplainer/1.0",
-            })
-            with urllib.request.urlopen(req, timeout=10) as resp:
-                return json.loads(resp.read().decode()).get("result")
+            payload = {"jsonrpc": "2.0", "id": 1, "method": method, "params": params}
+            resp = SESSION.post(rpc_url, json=payload, timeout=10)
+            return resp.json().get("result")
 
         result = rpc_call("eth_getTransactionByHash", [tx_hash])
         if not result or not isinstance(result, dict):
@@ -447,67 +578,234 @@ def _check_chain(tx_hash, chain):
     return None
 
 
-def fetch_real_transaction(tx_hash):
-    print(f"📡 Searching across {len(ALL_CHAINS)} EVM chains...", flush=True)
-    start = time.time()
+# ── Lookup cache — repeat submissions of the same hash (UI refresh,
+# retries) skip the full chain sweep. Short TTL keeps reorg risk low.
+TX_CACHE = TTLCache(maxsize=2048, ttl=300)
+_tx_cache_lock = threading.Lock()
+
+# One long-lived probe pool shared by all requests — thread stacks are
+# reused instead of being created and torn down per lookup.
+_CHAIN_POOL = ThreadPoolExecutor(max_workers=8, thread_name_prefix="chainprobe")
+
+# ── Hit-frequency ordering — chains that actually match get probed first.
+# Counts persist across restarts so the ordering survives deploys.
+CHAIN_HITS = collections.Counter()
+_HITS_PATH = os.path.expanduser("~/.wallet_explainer/chain_hits.json")
+_HITS_SAVE_EVERY = 10
+_hits_lock = threading.Lock()
+_hits_unsaved = 0
+_hits_version = 0
+_probe_order = None
+_probe_order_version = -1
+
+
+def _load_chain_hits():
+    try:
+        with open(_HITS_PATH) as f:
+            CHAIN_HITS.update({int(k): v for k, v in json.load(f).items()})
+    except Exception:
+        pass
+
+
+def _record_chain_hit(chainid):
+    global _hits_unsaved, _hits_version
+    with _hits_lock:
+        CHAIN_HITS[chainid] += 1
+        _hits_version += 1
+        _hits_unsaved += 1
+        if _hits_unsaved < _HITS_SAVE_EVERY:
+            return
+        _hits_unsaved = 0
+        snapshot = dict(CHAIN_HITS)
+    try:
+        os.makedirs(os.path.dirname(_HITS_PATH), exist_ok=True)
+        with open(_HITS_PATH, "w") as f:
+            json.dump(snapshot, f)
+    except Exception:
+        pass
+
+
+def _chains_by_hit_frequency():
+    """ALL_CHAINS sorted by observed hit count; the curated priority order
+    breaks ties, so cold chains keep their hand-picked ranking. The sorted
+    tuple is cached and only rebuilt after a new hit changes the counts."""
+    global _probe_order, _probe_order_version
+    with _hits_lock:
+        if _probe_order_version != _hits_version:
+            _probe_order = tuple(sorted(ALL_CHAINS, key=lambda c: -CHAIN_HITS[c["chainid"]]))
+            _probe_order_version = _hits_version
+        return _probe_order
+
+
+_load_chain_hits()
+
+
+# ── Multichain RPC — optional provider endpoint (Alchemy/Ankr/DRPC style)
+# that routes JSON-RPC by chainid, letting one batched POST probe every
+# chain at once instead of sweeping them individually.
+MULTICHAIN_RPC = os.environ.get("MULTICHAIN_RPC_URL", "")
+
+_CHAINS_BY_ID = {c["chainid"]: c for c in ALL_CHAINS}
+
+
+def _try_multichain_rpc(tx_hash):
+    """Single batched POST: one eth_getTransactionByHash per chainid, tagged
+    via the JSON-RPC id. The first non-null result picks the chain; a second
+    call fetches its receipt."""
+    batch = [
+        {"jsonrpc": "2.0", "id": c["chainid"], "method": "eth_getTransactionByHash", "params": [tx_hash]}
+        for c in ALL_CHAINS
+    ]
+    try:
+        data = SESSION.post(MULTICHAIN_RPC, json=batch, timeout=10).json()
+        if not isinstance(data, list):
+            return None
+        for item in data:
+            result = item.get("result") if isinstance(item, dict) else None
+            if not isinstance(result, dict):
+                continue
+            chain = _CHAINS_BY_ID.get(item.get("id"))
+            if chain is None:
+                continue
+            data2 = SESSION.post(MULTICHAIN_RPC, json={
+                "jsonrpc": "2.0", "id": chain["chainid"],
+                "method": "eth_getTransactionReceipt", "params": [tx_hash],
+            }, timeout=10).json()
+            receipt = data2.get("result") if isinstance(data2, dict) else None
+            if not isinstance(receipt, dict):
+                receipt = {}
+            _record_chain_hit(chain["chainid"])
+            return _parse_tx(result, receipt, chain)
+    except Exception:
+        return None
+    return None
+
+
+# ── Mock mode — EXPLAINER_MOCK=1 serves a canned transaction so the demo
+# and local testing never touch the explorers or the LLM settlement path.
+USE_MOCK = os.environ.get("EXPLAINER_MOCK") == "1"
+
+
+# All constant — 21000 gas at 30 gwei formats to the same strings on every
+# call, so the dict is rendered once and per-request only hash and
+# explorer link are patched in.
+_MOCK_GAS_USED, _MOCK_GAS_PRICE_GWEI = 21000, 30
+_MOCK_TX_BASE = {
+    "from": "0x742d35cc6634c0532925a3b844bc454e4438f44e",
+    "to": "0x8ba1f109551bd432803012645ac136ddd64dba72",
+    "value": "0.050000 ETH",
+    "gasUsed": _MOCK_GAS_USED,
+    "gasPrice": f"{_MOCK_GAS_PRICE_GWEI:.2f} gwei",
+    "gasFeeETH": f"{(_MOCK_GAS_USED * _MOCK_GAS_PRICE_GWEI) / 1e9:.6f} ETH",
+    "blockNumber": 8543210,
+    "status": "Success",
+    "chain": "Sepolia",
+    "symbol": "ETH",
+    "isTestnet": True,
+    "tokenTransfers": [],
+    "isContractCall": False,
+    "inputData": "0x",
+    "nonce": 42,
+}
+
+
+def get_mock_transaction(tx_hash):
+    return {
+        **_MOCK_TX_BASE,
+        "hash": tx_hash,
+        "chainExplorer": f"https://sepolia.etherscan.io/tx/{tx_hash}",
+    }
 
-    priority = ALL_CHAINS[:15]
-    remaining = ALL_CHAINS[15:]
 
-    with ThreadPoolExecutor(max_workers=3) as pool:
-        futures = {pool.submit(_check_chain, tx_hash, c): c for c in priority}
+def fetch_real_transaction(tx_hash):
+    if USE_MOCK:
+        return get_mock_transaction(tx_hash)
+
+    with _tx_cache_lock:
+        cached = TX_CACHE.get(tx_hash)
+    if cached is not None:
+        log.debug("♻️  Cache hit for %s...", tx_hash[:14])
+        return cached
+
+    log.debug("📡 Searching across %d EVM chains...", len(ALL_CHAINS))
+    start = time.perf_counter()
+
+    # One round-trip resolves the chain when a multichain provider is
+    # configured; the per-chain sweep still runs if it comes up empty so
+    # chains the provider doesn't route stay covered.
+    if MULTICHAIN_RPC:
+        result = _try_multichain_rpc(tx_hash)
+        if result:
+            log.info("✅ Found via multichain RPC on %s in %.1fs", result['chain'], time.perf_counter() - start)
+            with _tx_cache_lock:
+                TX_CACHE[tx_hash] = result
+            return result
+
+    # Hottest chains are submitted first so they grab workers first;
+    # as_completed returns the winner as soon as any probe hits, and the
+    # still-queued probes are cancelled instead of running to completion.
+    futures = {_CHAIN_POOL.submit(_check_chain, tx_hash, c): c for c in _chains_by_hit_frequency()}
+    try:
         for f in as_completed(futures):
             result = f.result()
             if result:
                 chain = futures[f]
-                print(f"✅ Found on {chain['name']} in {time.time()-start:.1f}s", flush=True)
+                log.info("✅ Found on %s in %.1fs", chain['name'], time.perf_counter() - start)
+                _record_chain_hit(chain["chainid"])
+                with _tx_cache_lock:
+                    TX_CACHE[tx_hash] = result
                 return result
+    finally:
+        for f in futures:
+            f.cancel()
 
-    if remaining:
-        with ThreadPoolExecutor(max_workers=3) as pool:
-            futures = {pool.submit(_check_chain, tx_hash, c): c for c in remaining}
-            for f in as_completed(futures):
-                result = f.result()
-                if result:
-                    chain = futures[f]
-                    print(f"✅ Found on {chain['name']} in {time.time()-start:.1f}s", flush=True)
-                    return result
-
-    print(f"⚠️  Not found on any chain ({time.time()-start:.1f}s)", flush=True)
+    log.warning("⚠️  Not found on any chain (%.1fs)", time.perf_counter() - start)
     return None
 
 
+# Rendered once — only the hash varies per request.
+_FALLBACK_TX_BASE = {
+    "from": "unknown", "to": "unknown", "value": "unknown",
+    "gasUsed": 0, "gasPrice": "unknown", "gasFeeETH": "unknown",
+    "blockNumber": 0, "status": "Unknown", "chain": "Unknown",
+    "chainExplorer": "", "symbol": "ETH", "isTestnet": False,
+    "tokenTransfers": [], "isContractCall": False, "inputData": "0x", "nonce": 0,
+}
+
+
 def get_fallback_transaction(tx_hash):
-    return {
-        "hash": tx_hash, "from": "unknown", "to": "unknown", "value": "unknown",
-        "gasUsed": 0, "gasPrice": "unknown", "gasFeeETH": "unknown",
-        "blockNumber": 0, "status": "Unknown", "chain": "Unknown",
-        "chainExplorer": "", "symbol": "ETH", "isTestnet": False,
-        "tokenTransfers": [], "isContractCall": False, "inputData": "0x", "nonce": 0,
-    }
+    return {**_FALLBACK_TX_BASE, "hash": tx_hash}
 
 
 # ══════════════════════════════════════════════════════════════
 # OPENGRADIENT AI
 # ══════════════════════════════════════════════════════════════
 
+# Shared by every chat call — treat as immutable.
+SYSTEM_MSG = {
+    "role": "system",
+    "content": "You are a blockchain transaction analyst. Explain transactions clearly for beginners. Use markdown with ## headers and **bold**.",
+}
+
+
 def call_opengradient(prompt, max_retries=2):
     client = get_og_client()
     if client is None:
         return None
     for attempt in range(1, max_retries + 1):
         try:
-            print(f"🚀 LLM attempt {attempt}...", flush=True)
-            t = time.time()
+            log.debug("🚀 LLM attempt %d...", attempt)
+            t = time.perf_counter()
             result = client.llm.chat(
                 model=og.TEE_LLM.GEMINI_2_5_FLASH,
-                messages=[
-                    {"role": "system", "content": "You are a blockchain transaction analyst. Explain transactions clearly for beginners. Use markdown with ## headers and **bold**."},
-                    {"role": "user", "content": prompt},
-                ],
+                messages=[SYSTEM_MSG, {"role": "user", "content": prompt}],
                 max_tokens=600, temperature=0.3,
             )
-            print(f"✅ LLM responded in {time.time()-t:.1f}s", flush=True)
+            log.info("✅ LLM responded in %.1fs", time.perf_counter() - t)
+            if log.isEnabledFor(logging.DEBUG):
+                # repr of the SDK response can be large — only build it
+                # when someone is actually reading DEBUG logs
+                log.debug("📦 LLM result: %.200s", result)
             explanation = None
             if hasattr(result, "chat_output"):
                 co = result.chat_output
@@ -516,13 +814,16 @@ def call_opengradient(prompt, max_retries=2):
             if explanation:
                 return {"explanation": explanation, "payment_hash": payment_hash}
         except Exception as e:
-            print(f"❌ LLM attempt {attempt}: {e}", flush=True)
+            log.error(f"❌ LLM attempt {attempt}: {e}")
             if attempt < max_retries:
-                time.sleep(2)
+                # Exponential backoff with jitter so retries from concurrent
+                # requests don't land on the provider in lockstep. Under
+                # gevent, monkey-patched sleep yields to other greenlets.
+                time.sleep(min(2 ** attempt, 8) * random.uniform(0.5, 1.0))
     return None
 
 
-def analyze_transaction_data(tx_data):
+def _build_prompt(tx_data):
     chain_name = tx_data.get("chain", "Unknown")
     explorer_link = tx_data.get("chainExplorer", "")
     is_testnet = tx_data.get("isTestnet", False)
@@ -534,7 +835,7 @@ def analyze_transaction_data(tx_data):
             [f"- {t['amount']} {t['token']} → {t['to'][:12]}..." for t in trs]
         )
 
-    prompt = f"""Explain this {'testnet ' if is_testnet else ''}transaction from **{chain_name}** simply.
+    return f"""Explain this {'testnet ' if is_testnet else ''}transaction from **{chain_name}** simply.
 
 Sections: SUMMARY, CHAIN{' (TESTNET=test money)' if is_testnet else ''}, DETAILS, TOKEN TRANSFERS, GAS FEES, SUSPICION CHECK
 
@@ -545,30 +846,176 @@ Explorer: {explorer_link}
 
 Use ## headers, **bold**.
 
-{json.dumps(tx_data, indent=2)}"""
+{_dumps(tx_data)}"""
+
+
+def _live_proof(payment_hash):
+    return {
+        "paymentHash": payment_hash or "verified-no-settlement",
+        "model": "GEMINI_2_5_FLASH", "verifiedByTEE": True,
+        "explorerUrl": f"https://explorer.opengradient.ai/tx/{payment_hash}" if payment_hash else "https://explorer.opengradient.ai",
+        "settlementNetwork": "Base Sepolia", "inferenceNetwork": "OpenGradient", "mode": "LIVE",
+    }
+
 
-    result = call_opengradient(prompt)
+_MOCK_PROOF_BASE = {
+    "model": "fallback (no AI)", "verifiedByTEE": False,
+    "explorerUrl": "https://explorer.opengradient.ai",
+    "settlementNetwork": "Base Sepolia", "inferenceNetwork": "OpenGradient Testnet", "mode": "MOCK",
+}
+
+
+def _mock_proof(tx_hash):
+    # Deterministic and cheap — the MOCK proof id is cosmetic, so deriving
+    # it from the tx hash beats a CSPRNG syscall per fallback.
+    return {
+        **_MOCK_PROOF_BASE,
+        "paymentHash": "0x" + hashlib.blake2b(tx_hash.encode(), digest_size=32).hexdigest(),
+    }
+
+
+def _fallback_explanation(tx_data):
+    chain_name = tx_data.get("chain", "Unknown")
+    explorer_link = tx_data.get("chainExplorer", "")
+    return f"## Transaction on {chain_name}\n**From:** {tx_data['from']}\n**To:** {tx_data['to']}\n**Value:** {tx_data['value']}\n**Status:** {tx_data['status']}\n**Gas Fee:** {tx_data['gasFeeETH']}\n\n{f'[View on Explorer]({explorer_link})' if explorer_link else ''}\n\n⚠️ AI explanation unavailable."
+
+
+def analyze_transaction_data(tx_data):
+    result = call_opengradient(_build_prompt(tx_data))
 
     if result:
-        ph = result.get("payment_hash")
         return {
             "explanation": result["explanation"],
-            "proof": {
-                "paymentHash": ph or "verified-no-settlement",
-                "model": "GEMINI_2_5_FLASH", "verifiedByTEE": True,
-                "explorerUrl": f"https://explorer.opengradient.ai/tx/{ph}" if ph else "https://explorer.opengradient.ai",
-                "settlementNetwork": "Base Sepolia", "inferenceNetwork": "OpenGradient", "mode": "LIVE",
-            },
+            "proof": _live_proof(result.get("payment_hash")),
         }
 
     return {
-        "explanation": f"## Transaction on {chain_name}\n**From:** {tx_data['from']}\n**To:** {tx_data['to']}\n**Value:** {tx_data['value']}\n**Status:** {tx_data['status']}\n**Gas Fee:** {tx_data['gasFeeETH']}\n\n{f'[View on Explorer]({explorer_link})' if explorer_link else ''}\n\n⚠️ AI explanation unavailable.",
-        "proof": {
-            "paymentHash": "0x" + secrets.token_hex(32),
-            "model": "fallback (no AI)", "verifiedByTEE": False,
-            "explorerUrl": "https://explorer.opengradient.ai",
-            "settlementNetwork": "Base Sepolia", "inferenceNetwork": "OpenGradient Testnet", "mode": "MOCK",
-        },
+        "explanation": _fallback_explanation(tx_data),
+        "proof": _mock_proof(tx_data.get("hash", "")),
+    }
+
+
+def call_opengradient_stream(prompt):
+    """Yield ("delta", text) chunks, then one final ("proof", payment_hash).
+
+    Uses the SDK's streaming chat when it exposes one; otherwise falls back
+    to the blocking call and yields the whole explanation as a single chunk.
+    A final payment_hash of None means the LLM produced nothing. If the
+    stream dies mid-way the generator ends with ("error", None) instead of
+    a proof, so callers can tell a truncated explanation from a complete one.
+    """
+    client = get_og_client()
+    stream_fn = getattr(client.llm, "chat_stream", None) if client else None
+
+    if stream_fn is None:
+        result = call_opengradient(prompt)
+        if result:
+            yield ("delta", result["explanation"])
+            yield ("proof", result.get("payment_hash"))
+        else:
+            yield ("proof", None)
+        return
+
+    payment_hash = None
+    try:
+        chunks = stream_fn(
+            model=og.TEE_LLM.GEMINI_2_5_FLASH,
+            messages=[SYSTEM_MSG, {"role": "user", "content": prompt}],
+            max_tokens=600, temperature=0.3,
+        )
+        for chunk in chunks:
+            text = None
+            if isinstance(chunk, str):
+                text = chunk
+            elif isinstance(chunk, dict):
+                text = chunk.get("content") or chunk.get("delta")
+            else:
+                co = getattr(chunk, "chat_output", None)
+                if isinstance(co, dict):
+                    text = co.get("content")
+                payment_hash = getattr(chunk, "payment_hash", None) or payment_hash
+            if text:
+                yield ("delta", text)
+    except Exception as e:
+        log.error(f"❌ LLM stream: {e}")
+        yield ("error", None)
+        return
+    yield ("proof", payment_hash)
+
+
+# ══════════════════════════════════════════════════════════════
+# BACKGROUND JOBS
+# ══════════════════════════════════════════════════════════════
+# Clients that can't hold a connection open for the whole sweep + LLM
+# call submit with {"async": true}, get a job_id back immediately, and
+# poll for the result. Finished jobs linger 15 minutes, then expire.
+
+EXECUTOR = ThreadPoolExecutor(max_workers=16, thread_name_prefix="analysis")
+JOBS = TTLCache(maxsize=512, ttl=900)
+_jobs_lock = threading.Lock()
+
+# ── Analysis cache — a confirmed tx's explanation is immutable, so LIVE
+# results are kept for an hour. MOCK fallbacks are never cached: the next
+# attempt should get a fresh shot at the real LLM. Analyses of the
+# fallback transaction (chain sweep missed — often a tx that just hasn't
+# confirmed yet) aren't cached either, even when the LLM ran: once the tx
+# lands, the explanation must be rebuilt from the real data.
+_ANALYSIS_CACHE = TTLCache(maxsize=2048, ttl=3600)
+_analysis_lock = threading.Lock()
+
+# ── In-flight coalescing — N concurrent requests for the same hash share
+# one pipeline run (and one LLM bill) instead of issuing N.
+_INFLIGHT = {}
+_inflight_lock = threading.Lock()
+
+
+def _submit_analysis(tx_hash):
+    """Submit the pipeline for tx_hash, reusing an already-running future
+    for the same hash. Returns a concurrent.futures.Future."""
+    key = tx_hash.lower()
+    with _inflight_lock:
+        fut = _INFLIGHT.get(key)
+        if fut is None:
+            fut = EXECUTOR.submit(_run_analysis, tx_hash)
+            _INFLIGHT[key] = fut
+            fut.add_done_callback(lambda _f: _INFLIGHT.pop(key, None))
+    return fut
+
+# (tx_data key, response key) — every source key is guaranteed present by
+# _parse_tx / get_fallback_transaction, so no per-key defaults needed.
+_TX_KEYS = (
+    ("hash", "hash"), ("from", "from"), ("to", "to"), ("value", "value"),
+    ("gasUsed", "gasUsed"), ("gasPrice", "gasPrice"), ("gasFeeETH", "gasFee"),
+    ("status", "status"), ("blockNumber", "block"), ("chain", "chain"),
+    ("chainExplorer", "chainExplorer"), ("isTestnet", "isTestnet"),
+    ("tokenTransfers", "tokenTransfers"),
+)
+
+
+def _run_analysis(tx_hash):
+    """Full pipeline: chain lookup → LLM analysis → response payload."""
+    tx_data = fetch_real_transaction(tx_hash)
+    found = tx_data is not None
+    if not found:
+        log.warning("⚠️  Not found — fallback")
+        tx_data = get_fallback_transaction(tx_hash)
+
+    cache_key = tx_hash.lower()
+    with _analysis_lock:
+        analysis = _ANALYSIS_CACHE.get(cache_key)
+    if analysis is None:
+        analysis = analyze_transaction_data(tx_data)
+        if found and analysis["proof"]["mode"] == "LIVE":
+            with _analysis_lock:
+                _ANALYSIS_CACHE[cache_key] = analysis
+
+    log.info(f"📤 {analysis['proof']['mode']} | {tx_data.get('chain','?')}")
+
+    return {
+        "success": True,
+        "transaction": {out: tx_data[src] for src, out in _TX_KEYS},
+        "explanation": analysis["explanation"],
+        "proof": analysis["proof"],
     }
 
 
@@ -576,6 +1023,16 @@ Use ## headers, **bold**.
 # ROUTES
 # ══════════════════════════════════════════════════════════════
 
+def _ojson(obj, status=200):
+    """jsonify replacement that encodes through orjson when available."""
+    return app.response_class(_dumps(obj), status=status, mimetype="application/json")
+
+
+# Static assets are best served by a reverse proxy (see README); these
+# routes cover single-process deployments like Render. The app-wide
+# SEND_FILE_MAX_AGE_DEFAULT lets browsers and any CDN in front absorb
+# repeat asset fetches.
+
 @app.route("/")
 def index():
     return send_from_directory("public", "index.html")
@@ -584,6 +1041,20 @@ def index():
 def static_files(path):
     return send_from_directory("public", path)
 
+def _etag_matches(etag):
+    """True if the request's If-None-Match covers etag.
+
+    Flask-Compress rewrites outgoing ETags to "<etag>:gzip" / "<etag>:br",
+    so clients echo the suffixed form back — strip it before comparing.
+    """
+    if request.if_none_match.star_tag:
+        return True
+    for tag in request.if_none_match.as_set(include_weak=True):
+        if tag.rsplit(":", 1)[0] == etag:
+            return True
+    return False
+
+
 @app.route("/analyze-transaction", methods=["POST", "OPTIONS"])
 def analyze_transaction():
     if request.method == "OPTIONS":
@@ -592,50 +1063,138 @@ def analyze_transaction():
         data = request.get_json()
         tx_hash = data.get("txHash", "").strip() if data else ""
         if not tx_hash:
-            return jsonify({"error": "Please provide a transaction hash."}), 400
-        if not tx_hash.startswith("0x") or len(tx_hash) < 10:
-            return jsonify({"error": "Hash must start with '0x' and be valid hex."}), 400
+            return _ojson({"error": "Please provide a transaction hash."}, 400)
+        if not HASH_RE.match(tx_hash):
+            return _ojson({"error": "Hash must be 0x followed by 64 hex characters."}, 400)
+        # Normalize so 0xAB… and 0xab… collapse to one cache entry
+        tx_hash = tx_hash.lower()
+
+        log.info(f"🔍 Analyzing: {tx_hash}")
+
+        if data.get("async"):
+            job_id = secrets.token_hex(8)
+            with _jobs_lock:
+                JOBS[job_id] = _submit_analysis(tx_hash)
+            return _ojson({"job_id": job_id}, 202)
+
+        payload = _submit_analysis(tx_hash).result()
+
+        # Only a found tx's LIVE explanation is immutable, so only that
+        # combination gets an ETag and a long max-age; MOCK fallbacks and
+        # not-yet-confirmed (fallback-tx) payloads must never get pinned.
+        # The tag is derived from the body so any payload change — e.g. the
+        # tx confirming while the mode stays LIVE — breaks revalidation.
+        body = _dumps(payload)
+        cacheable = (payload["proof"]["mode"] == "LIVE"
+                     and payload["transaction"]["chain"] != "Unknown")
+        if cacheable:
+            etag = hashlib.sha256(body.encode()).hexdigest()[:16]
+            if _etag_matches(etag):
+                return "", 304, {"ETag": f'"{etag}"'}
+        resp = app.response_class(body, mimetype="application/json")
+        if cacheable:
+            resp.set_etag(etag)
+            resp.headers["Cache-Control"] = "public, max-age=3600"
+        else:
+            resp.headers["Cache-Control"] = "no-store"
+        return resp
+    except Exception as e:
+        log.exception(f"❌ {e}")
+        return _ojson({"error": "Something went wrong."}, 500)
+
+@app.route("/analyze-transaction/<job_id>")
+def analyze_transaction_job(job_id):
+    with _jobs_lock:
+        fut = JOBS.get(job_id)
+    if fut is None:
+        return _ojson({"error": "Unknown or expired job."}, 404)
+    if not fut.done():
+        return _ojson({"job_id": job_id, "status": "pending"}, 202)
+    try:
+        return _ojson(fut.result())
+    except Exception as e:
+        log.error(f"❌ job {job_id}: {e}")
+        return _ojson({"error": "Something went wrong."}, 500)
 
-        print(f"\n{'='*50}\n🔍 Analyzing: {tx_hash}", flush=True)
+def _sse(payload):
+    return f"data: {_dumps(payload)}\n\n"
 
-        tx_data = fetch_real_transaction(tx_hash)
-        if tx_data is None:
-            print("⚠️  Not found — fallback", flush=True)
-            tx_data = get_fallback_transaction(tx_hash)
 
-        analysis = analyze_transaction_data(tx_data)
+@app.route("/analyze-transaction/stream")
+def analyze_transaction_stream():
+    """SSE variant of /analyze-transaction — explanation tokens arrive as they
+    are generated instead of after the full LLM response."""
+    tx_hash = request.args.get("txHash", "").strip()
+    if not tx_hash:
+        return _ojson({"error": "Please provide a transaction hash."}, 400)
+    if not HASH_RE.match(tx_hash):
+        return _ojson({"error": "Hash must be 0x followed by 64 hex characters."}, 400)
+    tx_hash = tx_hash.lower()
 
-        print(f"📤 {analysis['proof']['mode']} | {tx_data.get('chain','?')}\n{'='*50}", flush=True)
-
-        return jsonify({
-            "success": True,
-            "transaction": {
-                "hash": tx_data["hash"], "from": tx_data["from"], "to": tx_data["to"],
-                "value": tx_data["value"], "gasUsed": tx_data["gasUsed"],
-                "gasPrice": tx_data["gasPrice"], "gasFee": tx_data["gasFeeETH"],
-                "status": tx_data["status"], "block": tx_data["blockNumber"],
-                "chain": tx_data.get("chain", "Unknown"),
-                "chainExplorer": tx_data.get("chainExplorer", ""),
-                "isTestnet": tx_data.get("isTestnet", False),
-                "tokenTransfers": tx_data.get("tokenTransfers", []),
-            },
-            "explanation": analysis["explanation"],
-            "proof": analysis["proof"],
-        })
-    except Exception as e:
-        print(f"❌ {e}", flush=True)
-        traceback.print_exc()
-        return jsonify({"error": "Something went wrong."}), 500
+    def generate():
+        tx_data = fetch_real_transaction(tx_hash)
+        found = tx_data is not None
+        if not found:
+            tx_data = get_fallback_transaction(tx_hash)
+        yield _sse({"type": "transaction", "transaction": tx_data})
+
+        # A cached LIVE analysis replays as one delta — no second inference.
+        # Cache entries describe a found tx, so they only apply when this
+        # request also found one; replaying them after a fallback fetch
+        # would contradict the transaction event just sent.
+        cache_key = tx_hash.lower()
+        if found:
+            with _analysis_lock:
+                cached = _ANALYSIS_CACHE.get(cache_key)
+            if cached is not None:
+                yield _sse({"type": "delta", "text": cached["explanation"]})
+                yield _sse({"type": "proof", "proof": cached["proof"]})
+                return
+
+        parts = []
+        payment_hash = None
+        completed = False
+        for kind, value in call_opengradient_stream(_build_prompt(tx_data)):
+            if kind == "delta":
+                parts.append(value)
+                yield _sse({"type": "delta", "text": value})
+            elif kind == "proof":
+                payment_hash = value
+                completed = True
+
+        # Only a cleanly finished stream over a found tx is cacheable — a
+        # mid-stream failure leaves a truncated explanation, and a fallback
+        # tx's explanation goes stale the moment the real one confirms.
+        if parts and completed:
+            proof = _live_proof(payment_hash)
+            if found:
+                with _analysis_lock:
+                    _ANALYSIS_CACHE[cache_key] = {"explanation": "".join(parts), "proof": proof}
+        else:
+            yield _sse({"type": "delta", "text": _fallback_explanation(tx_data)})
+            proof = _mock_proof(tx_hash)
+        yield _sse({"type": "proof", "proof": proof})
+
+    return Response(stream_with_context(generate()), mimetype="text/event-stream")
 
 @app.route("/chains")
 def chains_list():
-    return jsonify({"total": len(ALL_CHAINS), "chains": [{"name": c["name"], "chainid": c["chainid"], "symbol": c["symbol"]} for c in ALL_CHAINS]})
+    return _ojson({"total": len(ALL_CHAINS), "chains": [{"name": c["name"], "chainid": c["chainid"], "symbol": c["symbol"]} for c in ALL_CHAINS]})
+
+@app.route("/admin/reload-og", methods=["POST"])
+def reload_og():
+    """Reset the memoized client after rotating OG_PRIVATE_KEY."""
+    global _og_client
+    _og_client = None
+    return _ojson({"status": "reset"})
 
 @app.route("/debug")
 def debug():
     pk = os.environ.get("OG_PRIVATE_KEY", "")
-    return jsonify({
+    return _ojson({
         "sdk": OG_AVAILABLE,
+        # Report the memoized singleton's state — never build a client here
+        "client": "ready" if _og_client not in (None, False) else ("unavailable" if _og_client is False else "unchecked"),
         "key": f"{pk[:8]}..." if pk and "YOUR" not in pk else "NOT SET",
         "etherscan_key": "SET" if ETHERSCAN_KEY else "FREE TIER",
         "chains": len(ALL_CHAINS),
@@ -644,6 +1203,8 @@ def debug():
     })
 
 if __name__ == "__main__":
+    # Dev server only — production runs via:
+    #   USE_GEVENT=1 gunicorn -c gunicorn_conf.py server:app
     port = int(os.environ.get("PORT", 10000))
-    print(f"🛡️  http://0.0.0.0:{port} | SDK:{OG_AVAILABLE} | {len(ALL_CHAINS)} chains | {len(KNOWN_TOKENS)} tokens", flush=True)
+    log.info(f"🛡️  http://0.0.0.0:{port} | SDK:{OG_AVAILABLE} | {len(ALL_CHAINS)} chains | {len(KNOWN_TOKENS)} tokens")
     app.run(host="0.0.0.0", port=port, debug=False)